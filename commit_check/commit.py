@@ -22,11 +22,6 @@ def read_commit_msg(commit_msg_file) -> str:
 
 
 def check_commit_msg(checks: list, commit_msg_file: str = "") -> int:
-    if commit_msg_file is None or commit_msg_file == "":
-        commit_msg_file = get_default_commit_msg_file()
-
-    commit_msg = read_commit_msg(commit_msg_file)
-
     for check in checks:
         if check['regex'] == "":
             print(
@@ -35,6 +30,10 @@ def check_commit_msg(checks: list, commit_msg_file: str = "") -> int:
             return PASS
 
         if check['check'] == 'message':
+            # Only locate and read the message once there is a regex to match
+            if commit_msg_file is None or commit_msg_file == "":
+                commit_msg_file = get_default_commit_msg_file()
+            commit_msg = read_commit_msg(commit_msg_file)
             result = re.match(check['regex'], commit_msg)
             if result is None:
                 print_error_message(
@@ -49,9 +48,6 @@ def check_commit_msg(checks: list, commit_msg_file: str = "") -> int:
 
 
 def check_commit_signoff(checks: list, commit_msg_file: str = "") -> int:
-    if commit_msg_file is None or commit_msg_file == "":
-        commit_msg_file = get_default_commit_msg_file()
-
     for check in checks:
         if check['check'] == 'commit_signoff':
             if check['regex'] == "":
@@ -60,6 +56,8 @@ def check_commit_signoff(checks: list, commit_msg_file: str = "") -> int:
                 )
                 return PASS
 
+            if commit_msg_file is None or commit_msg_file == "":
+                commit_msg_file = get_default_commit_msg_file()
             commit_msg = read_commit_msg(commit_msg_file)
             commit_hash = get_commit_info("H")
             result = re.search(check['regex'], commit_msg)
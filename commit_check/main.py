@@ -5,16 +5,21 @@
 The module containing main entrypoint function.
 """
 import argparse
+import functools
 from commit_check import branch
 from commit_check import commit
 from commit_check import author
 from commit_check.util import validate_config
 from commit_check.error import error_handler
-from . import CONFIG_FILE, DEFAULT_CONFIG, PASS, __version__
+from . import CONFIG_FILE, DEFAULT_CONFIG, PASS, FAIL, __version__
 
 
+@functools.lru_cache(maxsize=1)
 def get_parser() -> argparse.ArgumentParser:
-    """Get and parser to interpret CLI args."""
+    """Get and parser to interpret CLI args.
+
+    The parser is built once and reused, parsing does not mutate it.
+    """
     parser = argparse.ArgumentParser(
         prog='commit-check',
         description="Check commit message, branch naming, committer name, email, and more."
@@ -98,16 +103,19 @@ def main() -> int:
             args.config,
         ) else DEFAULT_CONFIG
         checks = config['checks']
+        check_results = []
         if args.message:
-            retval = commit.check_commit_msg(checks, args.commit_msg_file)
+            check_results.append(commit.check_commit_msg(checks, args.commit_msg_file))
         if args.author_name:
-            retval = author.check_author(checks, "author_name")
+            check_results.append(author.check_author(checks, "author_name"))
         if args.author_email:
-            retval = author.check_author(checks, "author_email")
+            check_results.append(author.check_author(checks, "author_email"))
         if args.branch:
-            retval = branch.check_branch(checks)
+            check_results.append(branch.check_branch(checks))
         if args.commit_signoff:
-            retval = commit.check_commit_signoff(checks)
+            check_results.append(commit.check_commit_signoff(checks))
+        # Any failing check fails the whole run, not just the last one
+        retval = FAIL if FAIL in check_results else PASS
 
     if args.dry_run:
         retval = PASS
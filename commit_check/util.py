@@ -5,19 +5,46 @@
 A module containing utility functions.
 """
 
+import functools
 import subprocess
 import yaml
 from pathlib import PurePath
 from subprocess import CalledProcessError
 from commit_check import RED, GREEN, YELLOW, RESET_COLOR
 
-
+# Use libyaml's C loader when PyYAML is built with it, it is much faster.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Command prefix used to show a single commit in get_commit_info.
+_GIT_LOG_PREFIX = ('git', 'log', '-n', '1')
+
+# Static part of the rejection message, only the failure details vary per call.
+_ERROR_BANNER = "\n".join([
+    "Commit rejected by Commit-Check.                                  ",
+    "                                                                  ",
+    r"  (c).-.(c)    (c).-.(c)    (c).-.(c)    (c).-.(c)    (c).-.(c)  ",
+    r"   / ._. \      / ._. \      / ._. \      / ._. \      / ._. \   ",
+    r" __\( C )/__  __\( H )/__  __\( E )/__  __\( C )/__  __\( K )/__ ",
+    r"(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)",
+    r"   || E ||      || R ||      || R ||      || O ||      || R ||   ",
+    r" _.' '-' '._  _.' '-' '._  _.' '-' '._  _.' '-' '._  _.' '-' '._ ",
+    r"(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)",
+    r" `-´     `-´  `-´     `-´  `-´     `-´  `-´     `-´  `-´     `-´ ",
+    "                                                                  ",
+    "Commit rejected.                                                  ",
+    "                                                                  ",
+])
+
+
+@functools.lru_cache(maxsize=1)
 def get_branch_name() -> str:
     """Identify current branch name.
     .. note::
         With Git 2.22 and above supports `git branch --show-current`
         Please open an issue at https://github.com/commit-check/commit-check/issues
         if you encounter any issue.
+    .. note::
+        The result is cached for the rest of the process.
 
     :returns: A `str` describing the current branch name.
     """
@@ -29,6 +56,7 @@ def get_branch_name() -> str:
     return branch_name.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def get_commit_info(format_string: str, sha: str = "HEAD") -> str:
     """Get latest commits information
     :param format_string: could be
@@ -38,13 +66,13 @@ def get_commit_info(format_string: str, sha: str = "HEAD") -> str:
         - b  - body
         - H  - commit hash
     more: https://git-scm.com/docs/pretty-formats
+    .. note::
+        Results are cached per `format_string` and `sha` for the rest of the process.
 
     :returns: A `str`.
     """
     try:
-        commands = [
-            'git', 'log', '-n', '1', f"--pretty=format:%{format_string}", f"{sha}",
-        ]
+        commands = [*_GIT_LOG_PREFIX, f"--pretty=format:%{format_string}", f"{sha}"]
         output = cmd_output(commands)
     except CalledProcessError:
         output = ''
@@ -57,9 +85,7 @@ def cmd_output(commands: list) -> str:
 
     :returns: Get `str` output.
     """
-    result = subprocess.run(
-        commands, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8'
-    )
+    result = subprocess.run(commands, capture_output=True, encoding='utf-8')
     if result.returncode == 0 and result.stdout is not None:
         return result.stdout
     elif result.stderr != '':
@@ -77,12 +103,30 @@ def validate_config(path_to_config: str) -> dict:
     configuration = {}
     try:
         with open(PurePath(path_to_config)) as f:
-            configuration = yaml.safe_load(f)
+            configuration = yaml.load(f, Loader=YAML_LOADER)
     except FileNotFoundError:
         pass
     return configuration
 
 
+def format_error_message(check_type: str, regex: str, error: str, reason: str) -> str:
+    """Format error message.
+    :param check_type:
+    :param regex:
+    :param error:
+    :param reason:
+
+    :returns: The error message shown to user as a `str`
+    """
+    return "\n".join([
+        _ERROR_BANNER,
+        f"Type {YELLOW}{check_type}{RESET_COLOR} check failed => {RED}{reason}{RESET_COLOR} ",
+        f"It doesn't match regex: {regex}",
+        "",
+        error,
+    ])
+
+
 def print_error_message(check_type: str, regex: str, error: str, reason: str):
     """Print error message.
     :param check_type:
@@ -92,24 +136,7 @@ def print_error_message(check_type: str, regex: str, error: str, reason: str):
 
     :returns: Give error messages to user
     """
-    print("Commit rejected by Commit-Check.                                  ")
-    print("                                                                  ")
-    print(r"  (c).-.(c)    (c).-.(c)    (c).-.(c)    (c).-.(c)    (c).-.(c)  ")
-    print(r"   / ._. \      / ._. \      / ._. \      / ._. \      / ._. \   ")
-    print(r" __\( C )/__  __\( H )/__  __\( E )/__  __\( C )/__  __\( K )/__ ")
-    print(r"(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)(_.-/'-'\-._)")
-    print(r"   || E ||      || R ||      || R ||      || O ||      || R ||   ")
-    print(r" _.' '-' '._  _.' '-' '._  _.' '-' '._  _.' '-' '._  _.' '-' '._ ")
-    print(r"(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)(.-./`-´\.-.)")
-    print(r" `-´     `-´  `-´     `-´  `-´     `-´  `-´     `-´  `-´     `-´ ")
-    print("                                                                  ")
-    print("Commit rejected.                                                  ")
-    print("                                                                  ")
-    print(f"Type {YELLOW}{check_type}{RESET_COLOR} check failed => {RED}{reason}{RESET_COLOR} ", end='',)
-    print("")
-    print(f"It doesn't match regex: {regex}")
-    print("")
-    print(error)
+    print(format_error_message(check_type, regex, error, reason))
 
 
 def print_suggestion(suggest: str) -> None:
@@ -64,7 +64,7 @@ class TestAuthor:
             assert m_get_commit_info.call_count == 0
             assert m_re_match.call_count == 0
 
-        def test_check_author_with_len0_regex(self, mocker, capfd):
+        def test_check_author_with_len0_regex(self, mocker, capsys):
             # Must NOT call get_commit_info, re.match with `regex` with length 0.
             checks = [
                 {
@@ -84,7 +84,7 @@ class TestAuthor:
             assert retval == PASS
             assert m_get_commit_info.call_count == 0
             assert m_re_match.call_count == 0
-            out, _ = capfd.readouterr()
+            out, _ = capsys.readouterr()
             assert "Not found regex for author_name." in out
 
         def test_check_author_with_result_none(self, mocker):
@@ -174,7 +174,7 @@ class TestAuthor:
             assert m_get_commit_info.call_count == 0
             assert m_re_match.call_count == 0
 
-        def test_check_author_with_len0_regex(self, mocker, capfd):
+        def test_check_author_with_len0_regex(self, mocker, capsys):
             # Must NOT call get_commit_info, re.match with `regex` with length 0.
             checks = [
                 {
@@ -194,7 +194,7 @@ class TestAuthor:
             assert retval == PASS
             assert m_get_commit_info.call_count == 0
             assert m_re_match.call_count == 0
-            out, _ = capfd.readouterr()
+            out, _ = capsys.readouterr()
             assert "Not found regex for author_email." in out
 
         def test_check_author_with_result_none(self, mocker):
@@ -62,7 +62,7 @@ class TestBranch:
         assert m_get_branch_name.call_count == 0
         assert m_re_match.call_count == 0
 
-    def test_check_branch_with_len0_regex(self, mocker, capfd):
+    def test_check_branch_with_len0_regex(self, mocker, capsys):
         # Must NOT call get_branch_name, re.match with `regex` with length 0.
         checks = [
             {
@@ -82,7 +82,7 @@ class TestBranch:
         assert retval == PASS
         assert m_get_branch_name.call_count == 0
         assert m_re_match.call_count == 0
-        out, _ = capfd.readouterr()
+        out, _ = capsys.readouterr()
         assert "Not found regex for branch naming." in out
 
     def test_check_branch_with_result_none(self, mocker):
@@ -7,10 +7,17 @@ FAKE_BRANCH_NAME = "fake_commits_info"
 LOCATION = "commit_check.commit"
 # Commit message file
 MSG_FILE = '.git/COMMIT_EDITMSG'
+# used by get_commit_info mock in commit signoff tests
+FAKE_COMMIT_HASH = "fake_commit_hash"
 
 
 def test_get_default_commit_msg_file(mocker):
+    m_cmd_output = mocker.patch(
+        f"{LOCATION}.cmd_output",
+        return_value=".git\n"
+    )
     retval = get_default_commit_msg_file()
+    assert m_cmd_output.call_args[0][0] == ["git", "rev-parse", "--git-dir"]
     assert retval == ".git/COMMIT_EDITMSG"
 
 
@@ -50,12 +57,28 @@ def test_check_commit_with_different_check(mocker):
         "re.match",
         return_value="fake_commits_info"
     )
+    m_read_commit_msg = mocker.patch(f"{LOCATION}.read_commit_msg")
     retval = check_commit_msg(checks, MSG_FILE)
     assert retval == PASS
     assert m_re_match.call_count == 0
+    assert m_read_commit_msg.call_count == 0
 
 
-def test_check_commit_with_len0_regex(mocker, capfd):
+def test_check_commit_without_msg_file_skips_git(mocker):
+    # Must NOT look up the default commit message file when no message check runs.
+    checks = [{
+        "check": "branch",
+        "regex": "dummy_regex"
+    }]
+    m_get_default_commit_msg_file = mocker.patch(
+        f"{LOCATION}.get_default_commit_msg_file"
+    )
+    retval = check_commit_msg(checks)
+    assert retval == PASS
+    assert m_get_default_commit_msg_file.call_count == 0
+
+
+def test_check_commit_with_len0_regex(mocker, capsys):
     checks = [
         {
             "check": "message",
@@ -69,7 +92,7 @@ def test_check_commit_with_len0_regex(mocker, capfd):
     retval = check_commit_msg(checks, MSG_FILE)
     assert retval == PASS
     assert m_re_match.call_count == 0
-    out, _ = capfd.readouterr()
+    out, _ = capsys.readouterr()
     assert "Not found regex for commit message." in out
 
 
@@ -104,6 +127,14 @@ def test_check_commit_signoff(mocker):
         "error": "error",
         "suggest": "suggest"
     }]
+    mocker.patch(
+        f"{LOCATION}.read_commit_msg",
+        return_value="feat: commit without signoff"
+    )
+    mocker.patch(
+        f"{LOCATION}.get_commit_info",
+        return_value=FAKE_COMMIT_HASH
+    )
     m_re_search = mocker.patch(
         "re.search",
         return_value=None
@@ -114,10 +145,11 @@ def test_check_commit_signoff(mocker):
     m_print_suggestion = mocker.patch(
         f"{LOCATION}.print_suggestion"
     )
-    retval = check_commit_signoff(checks)
+    retval = check_commit_signoff(checks, MSG_FILE)
     assert retval == FAIL
     assert m_re_search.call_count == 1
     assert m_print_error_message.call_count == 1
+    assert m_print_error_message.call_args[0][3] == FAKE_COMMIT_HASH
     assert m_print_suggestion.call_count == 1
 
 
@@ -132,9 +164,13 @@ def test_check_commit_signoff_with_empty_regex(mocker):
         "re.match",
         return_value="fake_commits_info"
     )
+    m_get_default_commit_msg_file = mocker.patch(
+        f"{LOCATION}.get_default_commit_msg_file"
+    )
     retval = check_commit_signoff(checks)
     assert retval == PASS
     assert m_re_match.call_count == 0
+    assert m_get_default_commit_msg_file.call_count == 0
 
 
 def test_check_commit_signoff_with_empty_checks(mocker):
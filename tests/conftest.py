@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import pytest
+from types import SimpleNamespace
+from commit_check.util import get_branch_name, get_commit_info
+
+
+@pytest.fixture
+def set_argv(monkeypatch):
+    """Replace sys.argv for the duration of a test."""
+    def _set_argv(argv):
+        monkeypatch.setattr(sys, "argv", list(argv))
+    return _set_argv
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_real_subprocess():
+    """Stub subprocess.run so no test forks a real git or commit-check.
+
+    Tests configure the returned result through the fake_subprocess
+    fixture, or patch subprocess.run themselves to inspect call arguments.
+    """
+    result = SimpleNamespace(returncode=0, stdout="", stderr="")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(subprocess, "run", lambda *args, **kwargs: result)
+        yield result
+
+
+@pytest.fixture(autouse=True)
+def fake_subprocess(no_real_subprocess):
+    """Reset the shared subprocess.run result before each test."""
+    no_real_subprocess.returncode = 0
+    no_real_subprocess.stdout = ""
+    no_real_subprocess.stderr = ""
+    return no_real_subprocess
+
+
+@pytest.fixture(autouse=True)
+def clear_git_caches():
+    """Forget cached git lookups so each test sees its own mocks."""
+    get_branch_name.cache_clear()
+    get_commit_info.cache_clear()
@@ -1,9 +1,64 @@
-import sys
 import pytest
-from commit_check.main import main
-from commit_check import DEFAULT_CONFIG
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+from commit_check.main import main, get_parser
+from commit_check import CONFIG_FILE, DEFAULT_CONFIG, PASS, FAIL, __version__
 
 CMD = "commit-check"
+ALL_CHECKS_ARGV = [CMD, "--message", "--branch", "--author-name", "--commit-signoff"]
+# used by validate_config mock
+DUMMY_CONFIG = {"checks": [{"check": "dummy_check_type"}]}
+
+# index into (commit, branch, author, signoff) results for each check flag
+FLAG_RESULT_INDEX = {
+    "--message": 0,
+    "--branch": 1,
+    "--author-name": 2,
+    "--author-email": 2,
+    "--commit-signoff": 3,
+}
+
+
+def argv_id(value):
+    """Name parametrized cases after their command line flags."""
+    if isinstance(value, list):
+        return "+".join(arg.lstrip("-") for arg in value[1:])
+    return None
+
+
+def expected_result(argv, results):
+    """PASS under --dry-run, otherwise FAIL if any enabled check fails."""
+    if "--dry-run" in argv:
+        return PASS
+    active = [results[FLAG_RESULT_INDEX[arg]] for arg in argv if arg in FLAG_RESULT_INDEX]
+    return FAIL if FAIL in active else PASS
+
+
+@pytest.fixture(scope="module")
+def module_mocks():
+    """Patch config loading and every check dispatched by main() once per module."""
+    targets = {
+        "config": "commit_check.main.validate_config",
+        "commit": "commit_check.commit.check_commit_msg",
+        "branch": "commit_check.branch.check_branch",
+        "author": "commit_check.author.check_author",
+        "signoff": "commit_check.commit.check_commit_signoff",
+    }
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{
+            name: stack.enter_context(patch(target))
+            for name, target in targets.items()
+        })
+
+
+@pytest.fixture(autouse=True)
+def patched_checks(module_mocks):
+    """Reset the module-wide mocks so each test starts from a clean state."""
+    for m in vars(module_mocks).values():
+        m.reset_mock(return_value=True, side_effect=True)
+    module_mocks.config.return_value = DUMMY_CONFIG
+    return module_mocks
 
 
 class TestMain:
@@ -19,89 +74,85 @@ class TestMain:
         ([CMD, "--message", "--branch", "--author-email"], 1, 1, 1, 0),
         ([CMD, "--branch", "--message", "--author-name", "--author-email"], 1, 1, 2, 0),
         ([CMD, "--dry-run"], 0, 0, 0, 0),
-    ])
+    ], ids=argv_id)
     def test_main(
             self,
-            mocker,
+            set_argv,
+            patched_checks,
             argv,
             check_commit_call_count,
             check_branch_call_count,
             check_author_call_count,
             check_commit_signoff_call_count,
     ):
-        mocker.patch(
-            "commit_check.main.validate_config",
-            return_value={
-                "checks": [
-                    {"check": "dummy_check_type"}
-                ]
-            }
-        )
-        m_check_commit = mocker.patch("commit_check.commit.check_commit_msg")
-        m_check_branch = mocker.patch("commit_check.branch.check_branch")
-        m_check_author = mocker.patch("commit_check.author.check_author")
-        m_check_commit_signoff = mocker.patch("commit_check.commit.check_commit_signoff")
-        sys.argv = argv
+        set_argv(argv)
         main()
-        assert m_check_commit.call_count == check_commit_call_count
-        assert m_check_branch.call_count == check_branch_call_count
-        assert m_check_author.call_count == check_author_call_count
-        assert m_check_commit_signoff.call_count == check_commit_signoff_call_count
-
-    def test_main_help(self, mocker, capfd):
-        mocker.patch(
-            "commit_check.main.validate_config",
-            return_value={
-                "checks": [
-                    {"check": "dummy_check_type"}
-                ]
-            }
-        )
-        m_check_commit = mocker.patch("commit_check.commit.check_commit_msg")
-        m_check_branch = mocker.patch("commit_check.branch.check_branch")
-        m_check_author = mocker.patch("commit_check.author.check_author")
-        m_check_commit_signoff = mocker.patch("commit_check.commit.check_commit_signoff")
-        sys.argv = ["commit-check", "--h"]
-        with pytest.raises(SystemExit):
-            main()
-        assert m_check_commit.call_count == 0
-        assert m_check_branch.call_count == 0
-        assert m_check_author.call_count == 0
-        assert m_check_commit_signoff.call_count == 0
-        stdout, _ = capfd.readouterr()
-        assert "usage: " in stdout
-
-    def test_main_version(self, mocker):
-        mocker.patch(
-            "commit_check.main.validate_config",
-            return_value={
-                "checks": [
-                    {"check": "dummy_check_type"}
-                ]
-            }
-        )
-        m_check_commit = mocker.patch("commit_check.commit.check_commit_msg")
-        m_check_branch = mocker.patch("commit_check.branch.check_branch")
-        m_check_author = mocker.patch("commit_check.author.check_author")
-        m_check_commit_signoff = mocker.patch("commit_check.commit.check_commit_signoff")
-        sys.argv = ["commit-check", "--v"]
-        with pytest.raises(SystemExit):
-            main()
-        assert m_check_commit.call_count == 0
-        assert m_check_branch.call_count == 0
-        assert m_check_author.call_count == 0
-        assert m_check_commit_signoff.call_count == 0
-
-    def test_main_validate_config_ret_none(self, mocker):
-        mocker.patch(
-            "commit_check.main.validate_config",
-            return_value={}
-        )
-        m_check_commit = mocker.patch("commit_check.commit.check_commit_msg")
-        mocker.patch("commit_check.branch.check_branch")
-        mocker.patch("commit_check.author.check_author")
-        mocker.patch("commit_check.commit.check_commit_signoff")
-        sys.argv = ["commit-check", "--message"]
+        assert patched_checks.commit.call_count == check_commit_call_count
+        assert patched_checks.branch.call_count == check_branch_call_count
+        assert patched_checks.author.call_count == check_author_call_count
+        assert patched_checks.signoff.call_count == check_commit_signoff_call_count
+
+    # The first five cases form a pairwise covering array: with every check
+    # enabled, each pair of checks sees all four PASS/FAIL combinations.
+    @pytest.mark.parametrize("argv, check_commit_result, check_branch_result, check_author_result, check_commit_signoff_result, final_result", [
+        (argv, *results, expected_result(argv, results)) for argv, results in [
+            (ALL_CHECKS_ARGV, (PASS, PASS, PASS, PASS)),
+            (ALL_CHECKS_ARGV, (PASS, FAIL, FAIL, FAIL)),
+            (ALL_CHECKS_ARGV, (FAIL, PASS, FAIL, FAIL)),
+            (ALL_CHECKS_ARGV, (FAIL, FAIL, PASS, FAIL)),
+            (ALL_CHECKS_ARGV, (FAIL, FAIL, FAIL, PASS)),
+            ([CMD, "--message"], (PASS, FAIL, FAIL, FAIL)),
+            (ALL_CHECKS_ARGV + ["--dry-run"], (FAIL, FAIL, FAIL, FAIL)),
+        ]
+    ], ids=argv_id)
+    def test_main_multiple_checks(
+            self,
+            set_argv,
+            patched_checks,
+            argv,
+            check_commit_result,
+            check_branch_result,
+            check_author_result,
+            check_commit_signoff_result,
+            final_result,
+    ):
+        # A failing check must not be masked by a later passing one.
+        patched_checks.commit.return_value = check_commit_result
+        patched_checks.branch.return_value = check_branch_result
+        patched_checks.author.return_value = check_author_result
+        patched_checks.signoff.return_value = check_commit_signoff_result
+        set_argv(argv)
+        assert main() == final_result
+
+    def test_parser_defaults(self):
+        # Must select no check and the default config file without arguments.
+        args = get_parser().parse_args([])
+        assert args.config == CONFIG_FILE
+        assert args.commit_msg_file is None
+        assert not any([
+            args.message, args.branch, args.author_name,
+            args.author_email, args.commit_signoff, args.dry_run,
+        ])
+
+    @pytest.mark.parametrize("flag, expected_output", [
+        ("--h", "usage: "),
+        ("--v", __version__),
+    ], ids=["help", "version"])
+    def test_parser_help_and_version(self, capsys, flag, expected_output):
+        # argparse prints and exits on its own, main() adds nothing here.
+        with pytest.raises(SystemExit) as exit_info:
+            get_parser().parse_args([flag])
+        assert exit_info.value.code == 0
+        stdout, _ = capsys.readouterr()
+        assert expected_output in stdout
+
+    def test_main_validate_config_ret_none(self, set_argv, patched_checks):
+        patched_checks.config.return_value = {}
+        set_argv(["commit-check", "--message"])
         main()
-        assert m_check_commit.call_count == 1
-        assert m_check_commit.call_args[0][0] == DEFAULT_CONFIG["checks"]
+        assert patched_checks.commit.call_count == 1
+        assert patched_checks.commit.call_args[0][0] == DEFAULT_CONFIG["checks"]
+
+    def test_get_parser_is_cached(self):
+        # Must build the argument parser only once per process.
+        assert get_parser() is get_parser()
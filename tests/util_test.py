@@ -1,212 +1,192 @@
 import pytest
+from commit_check import RED, YELLOW, RESET_COLOR
 from commit_check.util import get_branch_name
 from commit_check.util import get_commit_info
 from commit_check.util import cmd_output
 from commit_check.util import validate_config
+from commit_check.util import YAML_LOADER
+from commit_check.util import format_error_message
 from commit_check.util import print_error_message
 from commit_check.util import print_suggestion
-from subprocess import CalledProcessError, PIPE
+from collections import namedtuple
+from subprocess import CalledProcessError
+
+# stands in for subprocess.CompletedProcess in cmd_output tests
+DummyProcessResult = namedtuple("DummyProcessResult", "returncode stdout stderr")
+# git command expected from get_branch_name
+BRANCH_NAME_ARGV = ["git", "rev-parse", "--abbrev-ref", "HEAD"]
+# git command expected from get_commit_info for each tested format string
+COMMIT_INFO_ARGV = {
+    format_string: ["git", "log", "-n", "1", f"--pretty=format:%{format_string}", "HEAD"]
+    for format_string in ("s", "an", "ae")
+}
+# config content read by validate_config through mock_open
+CONFIG_YAML = "checks:\n  - check: branch\n    regex: ^main$\n"
+# raised by the cmd_output mock, CalledProcessError's args are dummy
+GIT_ERROR = CalledProcessError(1, "dcmd")
+
+
+@pytest.fixture
+def m_cmd_output(mocker):
+    """Patch the cmd_output used by the git helpers, tests set its result."""
+    return mocker.patch("commit_check.util.cmd_output")
 
 
 class TestUtil:
     class TestGetBranchName:
-        def test_get_branch_name(self, mocker):
+        def test_get_branch_name(self, m_cmd_output):
             # Must call cmd_output with given argument.
-            m_cmd_output = mocker.patch(
-                "commit_check.util.cmd_output",
-                return_value=" fake_branch_name "
-            )
+            m_cmd_output.return_value = " fake_branch_name "
             retval = get_branch_name()
-            assert m_cmd_output.call_count == 1
-            assert m_cmd_output.call_args[0][0] == [
-                "git", "rev-parse", "--abbrev-ref", "HEAD"
-            ]
+            m_cmd_output.assert_called_once_with(BRANCH_NAME_ARGV)
             assert retval == "fake_branch_name"
 
-        def test_get_branch_name_with_exception(self, mocker):
+        def test_get_branch_name_is_cached(self, m_cmd_output):
+            # Must run git only once per process.
+            m_cmd_output.return_value = "fake_branch_name"
+            assert get_branch_name() == get_branch_name()
+            assert m_cmd_output.call_count == 1
+
+        def test_get_branch_name_with_exception(self, m_cmd_output):
             # Must return empty string when exception raises in cmd_output.
-            m_cmd_output = mocker.patch(
-                "commit_check.util.cmd_output",
-                return_value=" fake_branch_name "
-            )
-            # CalledProcessError's args also dummy
-            dummy_ret_code, dummy_cmd_name = 1, "dcmd"
-            m_cmd_output.side_effect = CalledProcessError(
-                dummy_ret_code,
-                dummy_cmd_name
-            )
+            m_cmd_output.side_effect = GIT_ERROR
             retval = get_branch_name()
-            assert m_cmd_output.call_count == 1
-            assert m_cmd_output.call_args[0][0] == [
-                "git", "rev-parse", "--abbrev-ref", "HEAD"
-            ]
+            m_cmd_output.assert_called_once_with(BRANCH_NAME_ARGV)
             assert retval == ""
 
     class TestGetCommitInfo:
-        @pytest.mark.parametrize("format_string", [
-            ("s"),
-            ("an"),
-            ("ae"),
-        ]
-        )
-        def test_get_commit_info(self, mocker, format_string):
+        @pytest.mark.parametrize("format_string", COMMIT_INFO_ARGV)
+        def test_get_commit_info(self, m_cmd_output, format_string):
             # Must call get_commit_info with given argument.
-            m_cmd_output = mocker.patch(
-                "commit_check.util.cmd_output",
-                return_value=" fake commit message "
-            )
+            m_cmd_output.return_value = " fake commit message "
             retval = get_commit_info(format_string)
-            assert m_cmd_output.call_count == 1
-            assert m_cmd_output.call_args[0][0] == [
-                "git", "log", "-n", "1", f"--pretty=format:%{format_string}", "HEAD"
-            ]
+            m_cmd_output.assert_called_once_with(COMMIT_INFO_ARGV[format_string])
             assert retval == " fake commit message "
 
-        def test_get_commit_info_with_exception(self, mocker):
+        def test_get_commit_info_is_cached(self, m_cmd_output):
+            # Must run git once per format string.
+            m_cmd_output.return_value = "fake commit message"
+            get_commit_info("s")
+            get_commit_info("s")
+            get_commit_info("b")
+            assert m_cmd_output.call_count == 2
+
+        def test_get_commit_info_with_exception(self, m_cmd_output):
             # Must return empty string when exception raises in cmd_output.
-            m_cmd_output = mocker.patch(
-                "commit_check.util.cmd_output",
-                return_value=" fake commit message "
-            )
-            # CalledProcessError's args also dummy
-            dummy_ret_code, dummy_cmd_name = 1, "dcmd"
-            m_cmd_output.side_effect = CalledProcessError(
-                dummy_ret_code,
-                dummy_cmd_name
-            )
+            m_cmd_output.side_effect = GIT_ERROR
             format_string = "s"
             retval = get_commit_info(format_string)
-            assert m_cmd_output.call_count == 1
-            assert m_cmd_output.call_args[0][0] == [
-                "git", "log", "-n", "1", f"--pretty=format:%{format_string}", "HEAD"
-            ]
+            m_cmd_output.assert_called_once_with(COMMIT_INFO_ARGV[format_string])
             assert retval == ""
 
     class TestCmdOutput:
-        # use DummyProcessResult in this test to access returncode, stdout and stderr attribute
-        class DummyProcessResult:
-            def __init__(self, returncode, stdout, stderr):
-                self.returncode = returncode
-                self.stdout = stdout
-                self.stderr = stderr
-
-        def test_cmd_output(self, mocker):
-            # Must subprocess.run with given argument.
-            m_subprocess_run = mocker.patch(
-                "subprocess.run",
-                return_value=self.DummyProcessResult(0, "ok", "")
-            )
+        @pytest.fixture
+        def m_subprocess_run(self, mocker):
+            """Patch subprocess.run with a mock, tests set its result."""
+            return mocker.patch("subprocess.run")
+
+        def test_cmd_output(self, fake_subprocess):
+            # Must return stdout when subprocess.run succeeds.
+            fake_subprocess.stdout = "ok"
             retval = cmd_output(["dummy_cmd"])
-            assert m_subprocess_run.call_count == 1
             assert retval == "ok"
 
-        @pytest.mark.parametrize("returncode, stdout, stderr", [
-            (1, "ok", "err"),
-            (0, None, "err"),
-            (1, None, "err"),
+        @pytest.mark.parametrize("returncode, stdout, stderr, expected", [
+            (1, "ok", "err", "err"),
+            (0, None, "err", "err"),
+            (1, None, "err", "err"),
+            (1, "ok", "", ""),
+            (0, None, "", ""),
+            (1, None, "", ""),
         ]
         )
-        def test_cmd_output_err(self, mocker, returncode, stdout, stderr):
-            # Must return stderr when  subprocess.run returns not empty stderr.
-            m_subprocess_run = mocker.patch(
-                "subprocess.run",
-                return_value=self.DummyProcessResult(
-                    returncode, stdout, stderr)
-            )
+        def test_cmd_output_err(self, m_subprocess_run, returncode, stdout, stderr, expected):
+            # Must return stderr, empty or not, when subprocess.run has no usable stdout.
+            m_subprocess_run.return_value = DummyProcessResult(returncode, stdout, stderr)
             dummy_cmd = ["dummy_cmd"]
             retval = cmd_output(dummy_cmd)
-            assert m_subprocess_run.call_count == 1
-            assert retval == stderr
-            assert m_subprocess_run.call_args[0][0] == dummy_cmd
-            assert m_subprocess_run.call_args[1] == {
-                'encoding': 'utf-8',
-                'stderr': PIPE,
-                "stdout": PIPE
-            }
-
-        @pytest.mark.parametrize("returncode, stdout, stderr", [
-            (1, "ok", ""),
-            (0, None, ""),
-            (1, None, ""),
-        ]
-        )
-        def test_cmd_output_err_with_len0_stderr(self, mocker, returncode, stdout, stderr):
-            # Must return empty string when subprocess.run returns empty stderr.
-            m_subprocess_run = mocker.patch(
-                "subprocess.run",
-                return_value=self.DummyProcessResult(
-                    returncode, stdout, stderr)
+            assert retval == expected
+            m_subprocess_run.assert_called_once_with(
+                dummy_cmd, capture_output=True, encoding="utf-8"
             )
-            dummy_cmd = ["dummy_cmd"]
-            retval = cmd_output(dummy_cmd)
-            assert m_subprocess_run.call_count == 1
-            assert retval == ""
-            assert m_subprocess_run.call_args[0][0] == dummy_cmd
-            assert m_subprocess_run.call_args[1] == {
-                'encoding': 'utf-8',
-                'stderr': PIPE,
-                "stdout": PIPE
-            }
 
     class TestValidateConfig:
         def test_validate_config(self, mocker):
-            # Must call yaml.safe_load.
-            mocker.patch("builtins.open")
+            # Must call yaml.load with the fastest safe loader available.
+            mocker.patch("commit_check.util.open", create=True)
             dummy_resp = {"key": "value"}
-            m_yaml_safe_load = mocker.patch(
-                "yaml.safe_load",
+            m_yaml_load = mocker.patch(
+                "yaml.load",
                 return_value=dummy_resp
             )
             retval = validate_config("dummy_path")
-            assert m_yaml_safe_load.call_count == 1
+            assert m_yaml_load.call_count == 1
+            assert m_yaml_load.call_args[1] == {"Loader": YAML_LOADER}
             assert retval == dummy_resp
 
         def test_validate_config_file_not_found(self, mocker):
-            # Must return empty dictionary when FileNotFoundError raises in built-in open.
-            mocker.patch("builtins.open").side_effect = FileNotFoundError
-            m_yaml_safe_load = mocker.patch("yaml.safe_load")
+            # Must return empty dictionary when FileNotFoundError raises in open.
+            mocker.patch(
+                "commit_check.util.open", create=True
+            ).side_effect = FileNotFoundError
+            m_yaml_load = mocker.patch("yaml.load")
             retval = validate_config("dummy_path")
-            assert m_yaml_safe_load.call_count == 0
+            assert m_yaml_load.call_count == 0
             assert retval == {}
 
-    class TestPrintErrorMessage:
-        @pytest.mark.parametrize("check_type, type_failed_msg", [
-            ("message", "check failed =>"),
-            ("branch", "check failed =>"),
-            ("author_name", "check failed =>"),
-            ("author_email", "check failed =>"),
-            ("commit_signoff", "check failed =>"),
+        def test_validate_config_parses_yaml(self, mocker):
+            # Must load config content into plain Python types, without touching disk.
+            mocker.patch(
+                "commit_check.util.open",
+                mocker.mock_open(read_data=CONFIG_YAML),
+                create=True
+            )
+            retval = validate_config("dummy_path")
+            assert retval == {"checks": [{"check": "branch", "regex": "^main$"}]}
+
+    class TestFormatErrorMessage:
+        @pytest.mark.parametrize("check_type", [
+            "message",
+            "branch",
+            "author_name",
+            "author_email",
+            "commit_signoff",
         ])
-        def test_print_error_message(self, capfd, check_type, type_failed_msg):
-            # Must print on stdout with given argument.
-            dummy_regex = "dummy regex"
-            dummy_reason = "failure reason"
-            dummy_error = "dummy error"
-            print_error_message(
+        def test_format_error_message(self, check_type):
+            # Must end with the failed check, the regex and the error, one per line.
+            message = format_error_message(
                 check_type,
-                dummy_regex,
-                dummy_error,
-                dummy_reason
+                "dummy regex",
+                "dummy error",
+                "failure reason"
             )
-            stdout, _ = capfd.readouterr()
-            assert "Commit rejected by Commit-Check" in stdout
-            assert "Commit rejected." in stdout
-            assert check_type in stdout
-            assert type_failed_msg in stdout
-            assert f"It doesn't match regex: {dummy_regex}" in stdout
-            assert dummy_error in stdout
+            assert message.startswith("Commit rejected by Commit-Check")
+            assert message.splitlines()[-4:] == [
+                f"Type {YELLOW}{check_type}{RESET_COLOR} check failed => {RED}failure reason{RESET_COLOR} ",
+                "It doesn't match regex: dummy regex",
+                "",
+                "dummy error",
+            ]
+
+    class TestPrintErrorMessage:
+        def test_print_error_message(self, capsys):
+            # Must print the formatted message on stdout.
+            args = ("branch", "dummy regex", "dummy error", "failure reason")
+            print_error_message(*args)
+            stdout, _ = capsys.readouterr()
+            assert stdout == format_error_message(*args) + "\n"
 
     class TestPrintSuggestion:
-        def test_print_suggestion(self, capfd):
+        def test_print_suggestion(self, capsys):
             # Must print on stdout with given argument.
             print_suggestion("dummy suggest")
-            stdout, _ = capfd.readouterr()
+            stdout, _ = capsys.readouterr()
             assert "Suggest:" in stdout
 
-        def test_print_suggestion_exit1(self, capfd):
+        def test_print_suggestion_exit1(self, capsys):
             # Must exit with 1 when "" passed
             with pytest.raises(SystemExit) as e:
                 print_suggestion("")
             assert e.value.code == 1
-            stdout, _ = capfd.readouterr()
+            stdout, _ = capsys.readouterr()
             assert "commit-check does not support" in stdout